@@ -21,8 +21,22 @@ class TkMantraNodeApp(sgtk.platform.Application):
     def init_app(self):
         """Initialize the app."""
 
-        tk_houdini_mantra = self.import_module("tk_houdini_mantranode")
-        self.handler = tk_houdini_mantra.TkMantraNodeHandler(self)
+        # the handler module is imported and the handler created the first
+        # time the handler is accessed rather than at engine startup.
+        self._handler = None
+
+    @property
+    def handler(self):
+        """The :class:`TkMantraNodeHandler` instance for this app.
+
+        The handler is created on first access.
+        """
+
+        if self._handler is None:
+            self._handler = self.import_module(
+                "tk_houdini_mantranode"
+            ).TkMantraNodeHandler(self)
+        return self._handler
 
     def convert_to_regular_mantra_nodes(self):
         """Convert Toolkit Mantra nodes to regular Mantra nodes.
@@ -40,9 +54,8 @@ class TkMantraNodeApp(sgtk.platform.Application):
 
         """
 
-        self.log_debug("Converting Toolkit Mantra nodes to built-in Mantra nodes.")
-        tk_houdini_mantra = self.import_module("tk_houdini_mantranode")
-        tk_houdini_mantra.TkMantraNodeHandler.convert_to_regular_mantra_nodes(self)
+        self.logger.debug("Converting Toolkit Mantra nodes to built-in Mantra nodes.")
+        self.handler.convert_to_regular_mantra_nodes()
 
     def convert_back_to_tk_mantra_nodes(self):
         """Convert regular Mantra nodes back to Toolkit Mantra nodes.
@@ -59,9 +72,10 @@ class TkMantraNodeApp(sgtk.platform.Application):
 
         """
 
-        self.log_debug("Converting built-in Mantra nodes back to Toolkit Mantra nodes.")
-        tk_houdini_mantra = self.import_module("tk_houdini_mantranode")
-        tk_houdini_mantra.TkMantraNodeHandler.convert_back_to_tk_mantra_nodes(self)
+        self.logger.debug(
+            "Converting built-in Mantra nodes back to Toolkit Mantra nodes."
+        )
+        self.handler.convert_back_to_tk_mantra_nodes()
 
     def get_nodes(self):
         """
@@ -75,10 +89,9 @@ class TkMantraNodeApp(sgtk.platform.Application):
         >>> tk_mantra_nodes = app.get_nodes()
         """
 
-        self.log_debug("Retrieving tk-houdini-mantra nodes...")
-        tk_houdini_mantra = self.import_module("tk_houdini_mantranode")
-        nodes = tk_houdini_mantra.TkMantraNodeHandler.get_all_tk_mantra_nodes()
-        self.log_debug("Found %s tk-houdini-mantra nodes." % (len(nodes),))
+        self.logger.debug("Retrieving tk-houdini-mantra nodes...")
+        nodes = self.handler.get_all_tk_mantra_nodes()
+        self.logger.debug("Found %s tk-houdini-mantra nodes.", len(nodes))
         return nodes
 
     def get_output_path(self, node):
@@ -93,10 +106,9 @@ class TkMantraNodeApp(sgtk.platform.Application):
         >>> output_path = app.get_output_path(tk_mantra_node)
         """
 
-        self.log_debug("Retrieving output path for %s" % (node,))
-        tk_houdini_mantra = self.import_module("tk_houdini_mantranode")
-        output_path = tk_houdini_mantra.TkMantraNodeHandler.get_output_path(node)
-        self.log_debug("Retrieved output path: %s" % (output_path,))
+        self.logger.debug("Retrieving output path for %s", node)
+        output_path = self.handler.get_output_path(node)
+        self.logger.debug("Retrieved output path: %s", output_path)
         return output_path
 
     def get_work_file_template(self):
@@ -10,6 +10,7 @@
 
 # built-ins
 import os
+import subprocess
 import sys
 
 # houdini
@@ -18,6 +19,17 @@ import hou
 # toolkit
 import sgtk
 
+# arguments of the command used to show a directory in the file browser of
+# the current platform, minus the directory itself. None on windows, where
+# the directory is opened with os.startfile instead, and on platforms that
+# aren't supported.
+if sgtk.util.is_linux():
+    _SHOW_IN_FS_CMD = ["xdg-open"]
+elif sgtk.util.is_macos():
+    _SHOW_IN_FS_CMD = ["open"]
+else:
+    _SHOW_IN_FS_CMD = None
+
 
 class TkMantraNodeHandler(object):
     """Handle Tk Mantra node operations and callbacks."""
@@ -65,14 +77,14 @@ class TkMantraNodeHandler(object):
     }
     """Mapping between tk mantra parms and corresponding render templates."""
 
-    TK_RESET_PARM_NAMES = [
+    TK_RESET_PARM_NAMES = (
         "soho_compression",
         "soho_mkpath",
         "vm_device",
         "vm_image_exr_compression",
         "vm_image_jpeg_quality",
         "vm_image_tiff_compression",
-    ]
+    )
     """The default parameters to reset when the profile changes."""
 
     TK_DEFAULT_UPDATE_PARM_MAPPING = {
@@ -86,10 +98,81 @@ class TkMantraNodeHandler(object):
     # Class methods
 
     @classmethod
-    def convert_back_to_tk_mantra_nodes(cls, app):
-        """Convert Mantra nodes back to Toolkit Mantra nodes.
+    def get_all_tk_mantra_nodes(cls):
+        """
+        Returns a list of all tk-houdini-mantranode instances in the current
+        session.
+        """
+
+        # get all instances of tk mantra nodes
+        tk_node_type = cls.TK_MANTRA_NODE_TYPE
+        return hou.nodeType(hou.ropNodeTypeCategory(), tk_node_type).instances()
+
+    @classmethod
+    def get_output_path(cls, node):
+        """
+        Returns the evaluated output path for the supplied node.
+        """
+
+        output_parm = node.parm(cls.NODE_OUTPUT_PATH_PARM)
+        return output_parm.eval()
+
+    ############################################################################
+    # Instance methods
+
+    def __init__(self, app):
+        """Initialize the handler.
+
+        :params app: The application instance.
+
+        """
+
+        # keep a reference to the app for easy access to templates, settings,
+        # logging methods, tank, context, etc.
+        self._app = app
+
+        # get and cache the list of profiles defined in the settings
+        self._output_profiles = {}
+        for output_profile in self._app.get_setting("output_profiles", []):
+            output_profile_name = output_profile["name"]
+
+            if output_profile_name in self._output_profiles:
+                self._app.log_warning(
+                    "Found multiple output profiles named '%s' for the "
+                    "Tk Mantra node! Only the first one will be available."
+                    % (output_profile_name,)
+                )
+                continue
+
+            self._output_profiles[output_profile_name] = output_profile
+            self._app.log_debug(
+                "Caching mantra output profile: '%s'" % (output_profile_name,)
+            )
+
+        # the output profile menu lists the profiles in this order, so the
+        # profile parm's value can be used to index into it directly.
+        self._output_profile_names = tuple(self._output_profiles)
+        self._output_profile_indices = {
+            name: index for (index, name) in enumerate(self._output_profile_names)
+        }
 
-        :param app: The calling Toolkit Application
+        # templates looked up by name. the configuration doesn't change for
+        # the lifetime of the app, so these never need to be refreshed.
+        self._templates_by_name = {}
+
+        # session ids of the nodes already seen as initialized. a node never
+        # goes back to being uninitialized, so its parm needn't be read again.
+        self._initialized_node_ids = set()
+
+        # the hip file path last cached on each node, keyed by session id
+        self._node_hip_paths = {}
+
+        # the last hip file path parsed with the work file template, along
+        # with the fields extracted from it
+        self._hipfile_fields = (None, {})
+
+    def convert_back_to_tk_mantra_nodes(self):
+        """Convert Mantra nodes back to Toolkit Mantra nodes.
 
         Note: only converts nodes that had previously been Toolkit Mantra
         nodes.
@@ -98,11 +181,11 @@ class TkMantraNodeHandler(object):
 
         # get all instances of the built-in mantra nodes
         mantra_nodes = hou.nodeType(
-            hou.ropNodeTypeCategory(), cls.HOU_MANTRA_NODE_TYPE
+            hou.ropNodeTypeCategory(), self.HOU_MANTRA_NODE_TYPE
         ).instances()
 
         if not mantra_nodes:
-            app.log_debug("No Mantra Nodes found for conversion.")
+            self._app.log_debug("No Mantra Nodes found for conversion.")
             return
 
         # iterate over all the mantra nodes and attempt to convert them
@@ -112,10 +195,10 @@ class TkMantraNodeHandler(object):
             user_dict = mantra_node.userDataDict()
 
             # get the output_profile from the dictionary
-            tk_output_profile_name = user_dict.get(cls.TK_OUTPUT_PROFILE_NAME_KEY)
+            tk_output_profile_name = user_dict.get(self.TK_OUTPUT_PROFILE_NAME_KEY)
 
             if not tk_output_profile_name:
-                app.log_warning(
+                self._app.log_warning(
                     "Mantra node '%s' does not have an output profile name. "
                     "Can't convert to Tk Mantra node. Continuing."
                     % (mantra_node.name(),)
@@ -123,31 +206,28 @@ class TkMantraNodeHandler(object):
                 continue
 
             # create new Shotgun Write node:
-            tk_node_type = TkMantraNodeHandler.TK_MANTRA_NODE_TYPE
-            tk_mantra_node = mantra_node.parent().createNode(tk_node_type)
+            tk_mantra_node = mantra_node.parent().createNode(self.TK_MANTRA_NODE_TYPE)
 
             # find the index of the stored name on the new tk mantra node
             # and set that item in the menu.
-            try:
-                output_profile_parm = tk_mantra_node.parm(
-                    TkMantraNodeHandler.TK_OUTPUT_PROFILE_PARM
-                )
-                output_profile_index = output_profile_parm.menuLabels().index(
-                    tk_output_profile_name
-                )
-                output_profile_parm.set(output_profile_index)
-            except ValueError:
-                app.log_warning(
+            output_profile_index = self._output_profile_indices.get(
+                tk_output_profile_name
+            )
+            if output_profile_index is None:
+                self._app.log_warning(
                     "No output profile found named: %s" % (tk_output_profile_name,)
                 )
+            else:
+                output_profile_parm = tk_mantra_node.parm(self.TK_OUTPUT_PROFILE_PARM)
+                output_profile_parm.set(output_profile_index)
 
             # copy over all parameter values except the output path
-            _copy_parm_values(mantra_node, tk_mantra_node, excludes=[])
+            _copy_parm_values(mantra_node, tk_mantra_node)
 
             # explicitly copy AOV settings to the new tk mantra node
             plane_numbers = _get_extra_plane_numbers(mantra_node)
             for plane_number in plane_numbers:
-                plane_parm_name = cls.TK_EXTRA_PLANES_NAME % (plane_number,)
+                plane_parm_name = self.TK_EXTRA_PLANES_NAME % (plane_number,)
                 aov_name = user_dict.get(plane_parm_name)
                 tk_mantra_node.parm(plane_parm_name).set(aov_name)
 
@@ -172,55 +252,49 @@ class TkMantraNodeHandler(object):
             tk_mantra_node.setName(mantra_node_name)
             tk_mantra_node.setPosition(mantra_node_pos)
 
-            app.log_debug(
+            self._app.log_debug(
                 "Converted: Mantra node '%s' to TK Mantra node." % (mantra_node_name,)
             )
 
-    @classmethod
-    def convert_to_regular_mantra_nodes(cls, app):
-        """Convert Toolkit Mantra nodes to regular Mantra nodes.
-
-        :param app: The calling Toolkit Application
-
-        """
+    def convert_to_regular_mantra_nodes(self):
+        """Convert Toolkit Mantra nodes to regular Mantra nodes."""
 
         # get all instances of tk mantra nodes
-        tk_node_type = TkMantraNodeHandler.TK_MANTRA_NODE_TYPE
+        tk_node_type = self.TK_MANTRA_NODE_TYPE
         tk_mantra_nodes = hou.nodeType(
             hou.ropNodeTypeCategory(), tk_node_type
         ).instances()
 
         if not tk_mantra_nodes:
-            app.log_debug("No Toolkit Mantra Nodes found for conversion.")
+            self._app.log_debug("No Toolkit Mantra Nodes found for conversion.")
             return
 
         for tk_mantra_node in tk_mantra_nodes:
 
             # create a new, regular Mantra node
-            mantra_node = tk_mantra_node.parent().createNode(cls.HOU_MANTRA_NODE_TYPE)
+            mantra_node = tk_mantra_node.parent().createNode(self.HOU_MANTRA_NODE_TYPE)
 
             # copy across knob values
-            exclude_parms = [
-                parm
-                for parm in tk_mantra_node.parms()
-                if parm.name().startswith("sgtk_")
-            ]
-            _copy_parm_values(tk_mantra_node, mantra_node, excludes=exclude_parms)
+            parm_names = (parm.name() for parm in tk_mantra_node.parms())
+            exclude_parm_names = {
+                parm_name for parm_name in parm_names if parm_name.startswith("sgtk_")
+            }
+            _copy_parm_values(tk_mantra_node, mantra_node, excludes=exclude_parm_names)
 
             # store the mantra output profile name in the user data so that we
             # can retrieve it later.
-            output_profile_parm = tk_mantra_node.parm(cls.TK_OUTPUT_PROFILE_PARM)
-            tk_output_profile_name = output_profile_parm.menuLabels()[
-                output_profile_parm.eval()
-            ]
+            output_profile_index = tk_mantra_node.parm(
+                self.TK_OUTPUT_PROFILE_PARM
+            ).eval()
+            tk_output_profile_name = self._output_profile_names[output_profile_index]
             mantra_node.setUserData(
-                cls.TK_OUTPUT_PROFILE_NAME_KEY, tk_output_profile_name
+                self.TK_OUTPUT_PROFILE_NAME_KEY, tk_output_profile_name
             )
 
             # store AOV info on the new node
             plane_numbers = _get_extra_plane_numbers(tk_mantra_node)
             for plane_number in plane_numbers:
-                plane_parm_name = cls.TK_EXTRA_PLANES_NAME % (plane_number,)
+                plane_parm_name = self.TK_EXTRA_PLANES_NAME % (plane_number,)
                 mantra_node.setUserData(
                     plane_parm_name, tk_mantra_node.parm(plane_parm_name).eval()
                 )
@@ -244,63 +318,11 @@ class TkMantraNodeHandler(object):
             mantra_node.setName(tk_mantra_node_name)
             mantra_node.setPosition(tk_mantra_node_pos)
 
-            app.log_debug(
+            self._app.log_debug(
                 "Converted: Tk Mantra node '%s' to Mantra node."
                 % (tk_mantra_node_name,)
             )
 
-    @classmethod
-    def get_all_tk_mantra_nodes(cls):
-        """
-        Returns a list of all tk-houdini-mantranode instances in the current
-        session.
-        """
-
-        # get all instances of tk mantra nodes
-        tk_node_type = TkMantraNodeHandler.TK_MANTRA_NODE_TYPE
-        return hou.nodeType(hou.ropNodeTypeCategory(), tk_node_type).instances()
-
-    @classmethod
-    def get_output_path(cls, node):
-        """
-        Returns the evaluated output path for the supplied node.
-        """
-
-        output_parm = node.parm(cls.NODE_OUTPUT_PATH_PARM)
-        return output_parm.eval()
-
-    ############################################################################
-    # Instance methods
-
-    def __init__(self, app):
-        """Initialize the handler.
-
-        :params app: The application instance.
-
-        """
-
-        # keep a reference to the app for easy access to templates, settings,
-        # logging methods, tank, context, etc.
-        self._app = app
-
-        # get and cache the list of profiles defined in the settings
-        self._output_profiles = {}
-        for output_profile in self._app.get_setting("output_profiles", []):
-            output_profile_name = output_profile["name"]
-
-            if output_profile_name in self._output_profiles:
-                self._app.log_warning(
-                    "Found multiple output profiles named '%s' for the "
-                    "Tk Mantra node! Only the first one will be available."
-                    % (output_profile_name,)
-                )
-                continue
-
-            self._output_profiles[output_profile_name] = output_profile
-            self._app.log_debug(
-                "Caching mantra output profile: '%s'" % (output_profile_name,)
-            )
-
     ############################################################################
     # methods and callbacks executed via the OTL
 
@@ -319,9 +341,11 @@ class TkMantraNodeHandler(object):
     def get_output_profile_menu_labels(self):
         """Returns labels for all tk-houdini-mantranode output profiles."""
 
-        menu_labels = []
-        for count, output_profile_name in enumerate(self._output_profiles):
-            menu_labels.extend([count, output_profile_name])
+        # interleave the menu indices with the profile names
+        num_profiles = len(self._output_profile_names)
+        menu_labels = [None] * (num_profiles * 2)
+        menu_labels[0::2] = range(num_profiles)
+        menu_labels[1::2] = self._output_profile_names
 
         return menu_labels
 
@@ -335,18 +359,26 @@ class TkMantraNodeHandler(object):
 
         """
 
-        if not None:
+        if not node:
             node = hou.pwd()
 
         # is this the first time this has been created?
-        is_first_run = node.parm(self.TK_INIT_PARM_NAME).eval() == "True"
-        if is_first_run:
-            # set it to false for subsequent calls
-            node.parm(is_first_run).set("False")
-
-        # see if the hip file has changed
+        is_first_run = False
+        node_id = node.sessionId()
+        if node_id not in self._initialized_node_ids:
+            init_parm = node.parm(self.TK_INIT_PARM_NAME)
+            is_first_run = init_parm.eval() == "True"
+            if is_first_run:
+                # set it to false for subsequent calls
+                init_parm.set("False")
+            self._initialized_node_ids.add(node_id)
+
+        # see if the hip file has changed. only read the path cached on the
+        # node if it differs from the one we last saw cached there.
+        hip_path = hou.hipFile.path()
         hip_path_changed = (
-            hou.hipFile.path() != node.parm(self.TK_HIP_PATH_PARM_NAME).eval()
+            self._node_hip_paths.get(node_id) != hip_path
+            and node.parm(self.TK_HIP_PATH_PARM_NAME).eval() != hip_path
         )
 
         if is_first_run or hip_path_changed:
@@ -354,7 +386,9 @@ class TkMantraNodeHandler(object):
             self.reset_render_path(node)
 
             # cache current hip file path to compare against later
-            node.parm(self.TK_HIP_PATH_PARM_NAME).set(hou.hipFile.path())
+            node.parm(self.TK_HIP_PATH_PARM_NAME).set(hip_path)
+
+        self._node_hip_paths[node_id] = hip_path
 
         # get path from hidden parameter which acts like a cache.
         path = node.parm(self.NODE_OUTPUT_PATH_PARM).unexpandedString()
@@ -371,10 +405,12 @@ class TkMantraNodeHandler(object):
 
         return menu
 
-    def reset_render_path(self, node=None):
+    def reset_render_path(self, node=None, output_profile=None):
         """Reset the render path of the specified node.
 
         :param hou.Node node: The node being acted upon.
+        :param dict output_profile: Optional, the node's current output
+            profile if the caller already has it.
 
         This will force the render path to be updated based on the current
         script path and configuraton.
@@ -388,8 +424,23 @@ class TkMantraNodeHandler(object):
         if node.name().startswith("original0"):
             return
 
+        if output_profile is None:
+            output_profile = self._get_output_profile(node)
+
+        # the work file fields are the same for every path computed below
+        work_file_fields = self._get_hipfile_fields()
+
+        # the context fields only depend on the template, so they're looked
+        # up once per template and shared by all the paths computed below
+        context_fields = {}
+
+        # output paths are collected here and set on the node in one go
+        output_paths = {}
+
         for (parm_name, template_name) in self.TK_RENDER_TEMPLATE_MAPPING.items():
-            self._compute_and_set(node, parm_name, template_name)
+            output_paths[parm_name] = self._compute_output_path_or_error(
+                node, template_name, work_file_fields, output_profile, context_fields
+            )
 
         # Extra Image Planes / AOVs
         plane_numbers = _get_extra_plane_numbers(node)
@@ -398,22 +449,30 @@ class TkMantraNodeHandler(object):
 
             # only compute the template path if plane is using a different file
             if usefile_parm.eval():
+                plane_suffix = str(plane_number)
+                aov_name = node.parm(self.TK_EXTRA_PLANES_NAME % (plane_number,)).eval()
                 for (
                     parm_name,
                     template_name,
                 ) in self.TK_EXTRA_PLANE_TEMPLATE_MAPPING.items():
-                    parm_name = parm_name.replace("#", str(plane_number))
-                    aov_name = node.parm(
-                        self.TK_EXTRA_PLANES_NAME % (plane_number,)
-                    ).eval()
-                    self._compute_and_set(node, parm_name, template_name, aov_name)
-
-        # set the output paths
-        path = node.parm(self.NODE_OUTPUT_PATH_PARM).unexpandedString()
+                    parm_name = parm_name.replace("#", plane_suffix)
+                    output_paths[parm_name] = self._compute_output_path_or_error(
+                        node,
+                        template_name,
+                        work_file_fields,
+                        output_profile,
+                        context_fields,
+                        aov_name=aov_name,
+                    )
+
+        _set_locked_parms(node, output_paths)
+
+        # set the output paths. vm_picture is updated from sgtk_vm_picture
+        # along with the other mantra parms by update_parms.
+        path = output_paths[self.NODE_OUTPUT_PATH_PARM]
         node.parm("sgtk_vm_picture").set(path)
-        node.parm("vm_picture").set(path)
 
-        self.update_parms(node)
+        self.update_parms(node, plane_numbers=plane_numbers)
 
     def set_profile(self, node=None, reset=False):
         """Apply the selected profile in the session.
@@ -437,7 +496,7 @@ class TkMantraNodeHandler(object):
         if reset:
             for parm_name in self.TK_RESET_PARM_NAMES:
                 parm = node.parm(parm_name)
-                if parm:
+                if parm is not None:
                     parm.revertToDefaults()
 
             node.setColor(hou.Color([0.8, 0.8, 0.8]))
@@ -453,7 +512,7 @@ class TkMantraNodeHandler(object):
         if color:
             node.setColor(hou.Color(color))
 
-        self.reset_render_path(node)
+        self.reset_render_path(node, output_profile=output_profile)
 
     def show_in_fs(self):
         """Open a file browser showing the render path of the current node."""
@@ -469,10 +528,9 @@ class TkMantraNodeHandler(object):
         render_path = self._get_render_path(current_node)
 
         if render_path:
-            # the above method returns houdini style slashes, so ensure these
-            # are pointing correctly
-            render_path = render_path.replace("/", os.path.sep)
-
+            # the above method returns houdini style slashes. these work with
+            # os.path on all platforms, so they're only converted for the
+            # file browser command below.
             dir_name = os.path.dirname(render_path)
             if os.path.exists(dir_name):
                 render_dir = dir_name
@@ -494,20 +552,33 @@ class TkMantraNodeHandler(object):
         if render_dir:
             # TODO: move to utility method in core
 
-            # run the app
-            if sgtk.util.is_linux():
-                cmd = 'xdg-open "%s"' % render_dir
-            elif sgtk.util.is_macos:
-                cmd = "open '%s'" % render_dir
-            elif sgtk.util.is_windows():
-                cmd = 'cmd.exe /C start "Folder" "%s"' % render_dir
-            else:
+            if sgtk.util.is_windows():
+                # only windows needs the houdini style slashes converted.
+                # os.startfile opens the directory without going through
+                # cmd.exe, which would split it on characters like '&'.
+                render_dir = render_dir.replace("/", os.path.sep)
+                self._app.log_debug("Opening directory:\n '%s'" % (render_dir,))
+                try:
+                    os.startfile(render_dir)
+                except OSError:
+                    msg = "Failed to open '%s'!" % (render_dir,)
+                    hou.ui.displayMessage(msg)
+                return
+
+            if _SHOW_IN_FS_CMD is None:
                 msg = "Platform '%s' is not supported." % (sys.platform)
                 self._app.log_error(msg)
                 hou.ui.displayMessage(msg)
+                return
 
+            # run the app. no shell is involved, so the directory doesn't
+            # need quoting.
+            cmd = _SHOW_IN_FS_CMD + [render_dir]
             self._app.log_debug("Executing command:\n '%s'" % (cmd,))
-            exit_code = os.system(cmd)
+            try:
+                exit_code = subprocess.call(cmd)
+            except OSError:
+                exit_code = -1
             if exit_code != 0:
                 msg = "Failed to launch '%s'!" % (cmd,)
                 hou.ui.displayMessage(msg)
@@ -522,42 +593,48 @@ class TkMantraNodeHandler(object):
         default_name = self._app.get_setting("default_node_name")
         node.setName(default_name, unique_name=True)
 
-        # apply the default profile
+        # apply the default profile. this also puts the render paths in
+        # their default state.
         self.set_profile(node, reset=True)
 
-        # make sure the render paths are in default state
-        self.reset_render_path(node)
-
         try:
             self._app.log_metric("Create", log_version=True)
         except:
             # ingore any errors. ex: metrics logging not supported
             pass
 
-    def update_parms(self, node=None):
+    def update_parms(self, node=None, plane_numbers=None):
         """Update a set of predefined parameters as the render path changes.
 
         :param hou.Node node: The node being acted upon.
-
+        :param range plane_numbers: Optional, the node's extra plane numbers if
+            the caller already has them.
 
         """
 
         if not node:
             node = hou.pwd()
 
-        # copies the value of one parm to another
-        copy_parm = lambda p1, p2: node.parm(p2).set(node.parm(p1).unexpandedString())
+        # the values to copy, keyed by the name of the parm to copy them to.
+        # they're all set on the node in one go at the end.
+        get_parm = node.parm
+        parm_values = {}
 
         # copy the default udpate parms
         for parm1, parm2 in self.TK_DEFAULT_UPDATE_PARM_MAPPING.items():
-            copy_parm(parm1, parm2)
+            parm_values[parm2] = get_parm(parm1).unexpandedString()
 
         # handle additional planes
-        plane_numbers = _get_extra_plane_numbers(node)
+        if plane_numbers is None:
+            plane_numbers = _get_extra_plane_numbers(node)
+
         for plane_number in plane_numbers:
-            parm1 = "sgtk_vm_filename_plane" + str(plane_number)
-            parm2 = "vm_filename_plane" + str(plane_number)
-            copy_parm(parm1, parm2)
+            plane_suffix = str(plane_number)
+            parm_values["vm_filename_plane" + plane_suffix] = get_parm(
+                "sgtk_vm_filename_plane" + plane_suffix
+            ).unexpandedString()
+
+        node.setParms(parm_values)
 
     def use_file_plane(self, **kwargs):
         """Callback for "Different File" checkbox on every Extra Image Plane.
@@ -594,47 +671,73 @@ class TkMantraNodeHandler(object):
     ############################################################################
     # Private methods
 
-    def _compute_and_set(self, node, parm_name, template_name, aov_name=None):
-        """Compute and set and output path for the supplied parm.
+    def _compute_output_path_or_error(
+        self,
+        node,
+        template_name,
+        work_file_fields,
+        output_profile,
+        context_fields,
+        aov_name=None,
+    ):
+        """Compute an output path, or an error message if that fails.
 
         :param hou.Node node: The node being acted upon.
-        :param str parm_name: The name of the parameter to set.
         :param str template_name: The template to compute as the output path.
+        :param dict work_file_fields: The extracted fields of the current
+            work file.
+        :param dict output_profile: The node's current output profile.
+        :param dict context_fields: Context fields looked up so far during
+            the reset, keyed by output template name.
         :param str aov_name: Optional AOV name used during comput of path.
 
         """
 
         try:
-            path = self._compute_output_path(node, template_name, aov_name)
+            path = self._compute_output_path(
+                node,
+                template_name,
+                work_file_fields,
+                output_profile,
+                context_fields,
+                aov_name,
+            )
         except sgtk.TankError as err:
             self._app.log_warning("%s: %s" % (node.name(), err))
             path = "ERROR: %s" % (err,)
 
-        # Unlock, set, lock
-        node.parm(parm_name).lock(False)
-        node.parm(parm_name).set(path)
-        node.parm(parm_name).lock(True)
+        return path
 
-    def _compute_output_path(self, node, template_name, aov_name=None):
+    def _compute_output_path(
+        self,
+        node,
+        template_name,
+        work_file_fields,
+        output_profile,
+        context_fields,
+        aov_name=None,
+    ):
         """Compute output path based on current work file and render template.
 
         :param hou.Node node: The node being acted upon.
         :param str template_name: The name of template to compute a path for.
+        :param dict work_file_fields: The extracted fields of the current
+            work file.
+        :param dict output_profile: The node's current output profile.
+        :param dict context_fields: Context fields looked up so far during
+            the reset, keyed by output template name. The template's fields
+            are added to it if they aren't there yet.
         :param str aov_name: Optional AOV name used to compute the path.
 
         """
 
-        # Get relevant fields from the scene filename and contents
-        work_file_fields = self._get_hipfile_fields()
-
         if not work_file_fields:
             msg = "This Houdini file is not a Flow Production Tracking work file!"
             raise sgtk.TankError(msg)
 
-        output_profile = self._get_output_profile(node)
-
         # Get the render template from the app
-        output_template = self._app.get_template_by_name(output_profile[template_name])
+        output_template_name = output_profile[template_name]
+        output_template = self._get_template_by_name(output_template_name)
 
         # create fields dict with all the metadata
         fields = {
@@ -657,7 +760,11 @@ class TkMantraNodeHandler(object):
             fields["width"] = width
             fields["height"] = height
 
-        fields.update(self._app.context.as_template_fields(output_template))
+        if output_template_name not in context_fields:
+            context_fields[output_template_name] = self._app.context.as_template_fields(
+                output_template
+            )
+        fields.update(context_fields[output_template_name])
 
         path = output_template.apply_fields(fields)
         path = path.replace(os.path.sep, "/")
@@ -674,10 +781,8 @@ class TkMantraNodeHandler(object):
         if not node:
             node = hou.pwd()
 
-        output_profile_parm = node.parm(self.TK_OUTPUT_PROFILE_PARM)
-        output_profile_name = output_profile_parm.menuLabels()[
-            output_profile_parm.eval()
-        ]
+        output_profile_index = node.parm(self.TK_OUTPUT_PROFILE_PARM).eval()
+        output_profile_name = self._output_profile_names[output_profile_index]
         return self._output_profiles[output_profile_name]
 
     def _get_hipfile_fields(self):
@@ -685,11 +790,17 @@ class TkMantraNodeHandler(object):
 
         current_file_path = hou.hipFile.path()
 
+        # the fields can only change when the hip file path does
+        (cached_file_path, cached_work_fields) = self._hipfile_fields
+        if current_file_path == cached_file_path:
+            return cached_work_fields
+
         work_fields = {}
         work_file_template = self._app.get_template("work_file_template")
         if work_file_template and work_file_template.validate(current_file_path):
             work_fields = work_file_template.get_fields(current_file_path)
 
+        self._hipfile_fields = (current_file_path, work_fields)
         return work_fields
 
     def _get_render_path(self, node):
@@ -713,7 +824,7 @@ class TkMantraNodeHandler(object):
         output_profile = self._get_output_profile(node)
 
         # get the output cache template for the current profile
-        output_render_template = self._app.get_template_by_name(
+        output_render_template = self._get_template_by_name(
             output_profile["output_render_template"]
         )
 
@@ -734,6 +845,19 @@ class TkMantraNodeHandler(object):
             output_render_template, fields, ["SEQ", "eye"]
         )
 
+    def _get_template_by_name(self, template_name):
+        """Returns the named template, looking it up on first use only.
+
+        :param str template_name: The name of the template to return.
+
+        """
+
+        if template_name not in self._templates_by_name:
+            self._templates_by_name[template_name] = self._app.get_template_by_name(
+                template_name
+            )
+        return self._templates_by_name[template_name]
+
 
 ################################################################################
 # Utility methods
@@ -765,12 +889,12 @@ def _copy_parm_values(source_node, target_node, excludes=None):
 
     :param hou.Node source_node: Soure node with parm values to copy.
     :param hou.Node target_node: Target node to receive the copied parm values.
-    :parm list excludes: List of parm names to exclude during copy.
+    :parm set excludes: Set of parm names to exclude during copy.
 
     """
 
-    if not excludes:
-        excludes = []
+    # whatever was passed in, test the names against a set
+    excludes = frozenset(excludes or ())
 
     # build a parameter list from the source node, ignoring the excludes
     source_parms = [parm for parm in source_node.parms() if parm.name() not in excludes]
@@ -790,8 +914,9 @@ def _copy_parm_values(source_node, target_node, excludes=None):
             continue
 
         # if we have keys/expressions we need to copy them all.
-        if source_parm.keyframes():
-            for key in source_parm.keyframes():
+        keyframes = source_parm.keyframes()
+        if keyframes:
+            for key in keyframes:
                 target_parm.setKeyframe(key)
         else:
             # if the parameter is a string, copy the raw string.
@@ -819,15 +944,13 @@ def _copy_parm_values(source_node, target_node, excludes=None):
 
 
 def _get_extra_plane_numbers(node):
-    """Return a list of aov plane numbers.
+    """Return the range of aov plane numbers.
 
     :param hou.Node node: The node being acted upon.
 
     """
 
-    return list(
-        range(1, node.parm(TkMantraNodeHandler.TK_EXTRA_PLANE_COUNT_PARM).eval() + 1)
-    )
+    return range(1, node.parm(TkMantraNodeHandler.TK_EXTRA_PLANE_COUNT_PARM).eval() + 1)
 
 
 def _get_render_resolution(node):
@@ -871,3 +994,21 @@ def _move_outputs(source_node, target_node):
     for connection in source_node.outputConnections():
         output_node = connection.outputNode()
         output_node.setInput(connection.inputIndex(), target_node)
+
+
+def _set_locked_parms(node, parm_values):
+    """Set the values of locked parameters, leaving them locked afterwards.
+
+    :param hou.Node node: The node being acted upon.
+    :param dict parm_values: Map of parm names to the values to set.
+
+    """
+
+    parms = [node.parm(parm_name) for parm_name in parm_values]
+
+    # Unlock, set, lock
+    for parm in parms:
+        parm.lock(False)
+    node.setParms(parm_values)
+    for parm in parms:
+        parm.lock(True)